@@ -9,12 +9,17 @@ CaseFormer → Separator → B1 → B2 → B3 → B4 → Glue/Date → Palletize
 - Palletizer: random ≤ 3.33 s (default Uniform[2.0, 3.33])
 - Break handling with INCOMPLETE/COMPLETE pallet lock
 - CSV outputs: pallet_events.csv, sim_summary.csv, line_log.csv
+- Optional multi-seed replications in parallel → replications.csv
 
 OPTIMIZED: Removed blind 0.1s retries. Stations only retry when unblocked.
 """
 
-from dataclasses import dataclass
-import heapq, csv, math, random
+from array import array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import heapq, csv, itertools, math, multiprocessing, random, sys
 
 # ---------------- CONFIG ----------------
 CONFIG = {
@@ -49,10 +54,30 @@ CONFIG = {
     # Randomness
     "seed": 123,
     "jitter_pct": 0.00,             # extra ±% jitter (set 0 for clean tests)
+
+    # Output
+    "verbose": True,                # print pallet/pause events to stdout (once, after the run)
+
+    # Replications (independent runs, one per seed, in parallel)
+    "replication_seeds": [],        # e.g. list(range(1, 101)); empty = skip
+    "replication_workers": None,    # None = one per CPU
 }
 # --------------- END CONFIG ---------------
 
+# Stations in line order (index into Sim.busy / Sim.servers)
+ST_CF, ST_SEP, ST_B1, ST_B2, ST_B3, ST_B4, ST_GLUE, ST_PAL = range(8)
+N_STATIONS = 8
+
+# Event codes: try_* = station index, done_* = station index + 8
+# (handled by Sim._try(k) / Sim._done(k))
+(EV_TRY_CF, EV_TRY_SEP, EV_TRY_B1, EV_TRY_B2,
+ EV_TRY_B3, EV_TRY_B4, EV_TRY_GLUE, EV_TRY_PAL) = range(0, 8)
+(EV_DONE_CF, EV_DONE_SEP, EV_DONE_B1, EV_DONE_B2,
+ EV_DONE_B3, EV_DONE_B4, EV_DONE_GLUE, EV_DONE_PAL) = range(8, 16)
+EV_PAUSE_START, EV_PAUSE_END = 16, 17
+
 def to_sec(h, m): return h*3600 + m*60
+@lru_cache(maxsize=8192)
 def hhmmss(t):
     t = int(t) % (24*3600)
     h = t//3600; m=(t%3600)//60; s=t%60
@@ -75,32 +100,45 @@ def windows_from_shift(cfg):
         intervals=new
     return intervals, run_start, e
 
-def in_window(t, windows):
-    for a,b in windows:
-        if a<=t<b: return True
-    return False
-
-def tri(a,m,b):
-    u=random.random()
+def tri_sampler(a,m,b,rand):
+    # inverse-CDF Triangular(a,m,b) with the constants folded once
     c=(m-a)/(b-a)
-    return a + math.sqrt(u*(b-a)*(m-a)) if u<c else b - math.sqrt((1-u)*(b-a)*(b-m))
-
-def jitter(x, pct):
+    k_lo=(b-a)*(m-a); k_hi=(b-a)*(b-m)
+    sqrt=math.sqrt
+    def draw():
+        u=rand()
+        return a + sqrt(u*k_lo) if u<c else b - sqrt((1-u)*k_hi)
+    return draw
+
+def jitter(x, pct, rng):
     if pct<=0: return x
-    j = 1 + random.uniform(-pct, pct)
+    j = 1 + rng.uniform(-pct, pct)
     return max(0.001, x*j)
 
-@dataclass
-class ServerPool:
-    name: str
-    servers: int
-    busy: int = 0
-
 class Sim:
     def __init__(self, cfg):
-        random.seed(cfg["seed"])
+        # Per-instance RNG so independent Sims never share random state
+        self.rng = random.Random(cfg["seed"])
+        self._rand = self.rng.random
         self.cfg = cfg
+        self.verbose = cfg.get("verbose", False)
+        self._stdout_lines = []  # verbose output, written once at the end of run()
+
+        # Config values read by handlers, bound once (no dict lookups per event)
+        self._cpp = cfg["cases_per_pallet"]
+        self._jp  = cfg["jitter_pct"]
+        self._dur_cf, self._dur_sep, self._dur_glue = cfg["t_caseformer"], cfg["t_separator"], cfg["t_glue"]
+        b_lo, b_hi = cfg["bottler_range"]
+        self._draw_b = lambda: b_lo + (b_hi-b_lo)*self._rand()
+        if cfg["palletizer_dist"] == "tri":
+            self._draw_pal = tri_sampler(*cfg["palletizer_params"], self._rand)
+        else:
+            lo, hi = cfg["palletizer_params"]
+            self._draw_pal = lambda: lo + (hi-lo)*self._rand()
         self.windows, self.run_start, self.shift_end = windows_from_shift(cfg)
+        # sorted, disjoint windows flattened to [a0,b0,a1,b1,...]: t is inside a
+        # window exactly when bisect_right lands on an odd index
+        self._bounds = [x for ab in self.windows for x in ab]
         self.now   = self.run_start
 
         # Serial buffers after CF/Sep path through to palletizer
@@ -108,32 +146,54 @@ class Sim:
         self.bufcap = cfg["buffers"]
         self.buf = [0]*len(self.bufcap)
 
-        # Stations (single server each; parallelism can be added if needed)
-        self.cf   = ServerPool("CaseFormer", 1)
-        self.sep  = ServerPool("Separator",  1)
-        self.b    = [ServerPool(f"B{i+1}", 1) for i in range(4)]
-        self.glue = ServerPool("GlueDate",   1)
-        self.pal  = ServerPool("Palletizer", 1)
-
-        # Events heap: (time, typ, payload)
+        # Stations, indexed by ST_* (single server each; parallelism can be added if needed)
+        self.servers = [1]*N_STATIONS
+        self.busy    = [0]*N_STATIONS
+        # Station descriptors, indexed by ST_*:
+        #   (input buffer, output buffer, fixed cycle time or None, time draw)
+        # Station k reads buffer k-1 and writes buffer k; None = start/end of line.
+        # Without jitter, fixed cycle times are folded to constants and random ones
+        # skip the jitter() wrapper.
+        fold = self._jp <= 0
+        draw_b, draw_pal = (self._draw_b, self._draw_pal) if fold else (self.t_b, self.t_pal)
+        self._stations = [
+            (None, 0, self._dur_cf if fold else None, self.t_cf),
+            (0, 1, self._dur_sep if fold else None, self.t_sep),
+            (1, 2, None, draw_b), (2, 3, None, draw_b), (3, 4, None, draw_b), (4, 5, None, draw_b),
+            (5, 6, self._dur_glue if fold else None, self.t_glue),
+            (6, None, None, draw_pal),
+        ]
+        # Set when a station's last try failed on an empty input / full output
+        # buffer; only then does the neighbour's _done retry it.
+        self._idle_for_input  = [False]*N_STATIONS
+        self._idle_for_output = [False]*N_STATIONS
+
+        # Two-tier event queue:
+        # - now_queue: FIFO of zero-delay try_* event codes at self.now (start of
+        #   run and pause ends; _done calls neighbouring _try directly)
+        # - h: heap of future events (time, seq, typ, payload); seq breaks ties so
+        #   comparisons never reach typ/payload
+        self.now_queue = deque()
         self.h=[]
-        for name in ["CF","SEP","B1","B2","B3","B4","GLUE","PAL"]:
-            heapq.heappush(self.h, (self.run_start, f"try_{name}", None))
+        self._seq = itertools.count()
+        self.pending_try = set()   # try_* codes already in now_queue
+        for ev in range(EV_TRY_CF, EV_TRY_PAL+1):
+            self._notify(ev)
 
         # schedule pauses
         for h1,m1,h2,m2 in cfg["breaks"]:
             bs, be = to_sec(h1,m1), to_sec(h2,m2)
-            heapq.heappush(self.h, (bs, "pause_start", ("BREAK", bs, be)))
-            heapq.heappush(self.h, (be, "pause_end",   ("BREAK", bs, be)))
+            self._schedule(bs, EV_PAUSE_START, ("BREAK", bs, be))
+            self._schedule(be, EV_PAUSE_END,   ("BREAK", bs, be))
         for h1,m1,h2,m2 in cfg.get("downtimes", []):
             ds, de = to_sec(h1,m1), to_sec(h2,m2)
-            heapq.heappush(self.h, (ds, "pause_start", ("DOWNTIME", ds, de)))
-            heapq.heappush(self.h, (de, "pause_end",   ("DOWNTIME", ds, de)))
+            self._schedule(ds, EV_PAUSE_START, ("DOWNTIME", ds, de))
+            self._schedule(de, EV_PAUSE_END,   ("DOWNTIME", ds, de))
 
         # Counters
         self.cases_out = 0
         self.pallets   = 0
-        self.events    = []  # (pallet_seq, time_sec)
+        self.pallet_times = array("l")  # time_sec of pallet N at index N-1
         self.log       = []  # pause log
 
         # Pallet lock during pause
@@ -141,233 +201,186 @@ class Sim:
         self.lock_target_cases = None
 
     # ----- time draws -----
-    def t_cf(self):   return jitter(self.cfg["t_caseformer"], self.cfg["jitter_pct"])
-    def t_sep(self):  return jitter(self.cfg["t_separator"],  self.cfg["jitter_pct"])
-    def t_b(self):    # uniform [3,5]
-        lo, hi = self.cfg["bottler_range"]
-        return jitter(random.uniform(lo, hi), self.cfg["jitter_pct"])
-    def t_glue(self): return jitter(self.cfg["t_glue"], self.cfg["jitter_pct"])
-    def t_pal(self):
-        if self.cfg["palletizer_dist"] == "tri":
-            a,m,b = self.cfg["palletizer_params"]
-            return jitter(tri(a,m,b), self.cfg["jitter_pct"])
-        else:
-            lo, hi = self.cfg["palletizer_params"]
-            return jitter(random.uniform(lo, hi), self.cfg["jitter_pct"])
+    # uniform draws are inlined as lo + (hi-lo)*random(), same stream as rng.uniform
+    def t_cf(self):   return jitter(self._dur_cf,   self._jp, self.rng)
+    def t_sep(self):  return jitter(self._dur_sep,  self._jp, self.rng)
+    def t_b(self):    return jitter(self._draw_b(),   self._jp, self.rng)  # uniform [3,5]
+    def t_glue(self): return jitter(self._dur_glue, self._jp, self.rng)
+    def t_pal(self):  return jitter(self._draw_pal(), self._jp, self.rng)
 
     # ----- helpers -----
-    def can_run(self): return in_window(self.now, self.windows)
+    def can_run(self): return bisect_right(self._bounds, self.now) & 1 == 1
 
-    # ----- CF -----
-    def try_CF(self,_):
-        # OPTIMIZED: No blind retries. Only retry when conditions change.
-        if not self.can_run():
-            return  # pause_end will schedule retry
-        if self.cf.busy>=self.cf.servers:
-            return  # done_CF will schedule retry
-        if self.buf[0] >= self.bufcap[0]:
-            return  # done_SEP will schedule retry when buffer has space
-        dur = self.t_cf()
-        self.cf.busy += 1
-        heapq.heappush(self.h, (self.now+dur, "done_CF", None))
-        
-    def done_CF(self,_):
-        self.cf.busy -= 1
-        self.buf[0] += 1
-        heapq.heappush(self.h, (self.now, "try_CF", None))   # Can immediately try again
-        heapq.heappush(self.h, (self.now, "try_SEP", None))  # Notify downstream
-
-    # ----- SEP -----
-    def try_SEP(self,_):
-        if not self.can_run():
-            return
-        if self.sep.busy>=self.sep.servers:
-            return
-        if self.buf[0] <= 0:
-            return  # done_CF will notify us
-        if self.buf[1] >= self.bufcap[1]:
-            return  # done_B1 will notify us
-        dur = self.t_sep()
-        self.sep.busy += 1
-        heapq.heappush(self.h, (self.now+dur, "done_SEP", None))
-        
-    def done_SEP(self,_):
-        self.sep.busy -= 1
-        self.buf[0] -= 1
-        self.buf[1] += 1
-        heapq.heappush(self.h, (self.now, "try_SEP", None))  # Can try again
-        heapq.heappush(self.h, (self.now, "try_CF", None))   # Notify upstream (buffer freed)
-        heapq.heappush(self.h, (self.now, "try_B1", None))   # Notify downstream
-
-    # ----- Bottlers -----
-    def try_B(self, k, name):
-        pool = self.b[k]
-        in_idx = 1+k
-        out_idx = 2+k
-        if not self.can_run():
-            return
-        if pool.busy>=pool.servers:
+    def _schedule(self, t, typ, payload=None):
+        heapq.heappush(self.h, (t, next(self._seq), typ, payload))
+
+    def _notify(self, ev):
+        # at most one pending try per station; duplicates would be no-ops
+        if ev in self.pending_try:
             return
-        if self.buf[in_idx] <= 0:
-            return  # Previous stage will notify us
-        if self.buf[out_idx] >= self.bufcap[out_idx]:
-            return  # Next stage will notify us
-        dur = self.t_b()
-        pool.busy += 1
-        heapq.heappush(self.h, (self.now+dur, f"done_{name}", None))
-        
-    def done_B(self, k, name):
-        pool = self.b[k]
-        in_idx = 1+k
-        out_idx = 2+k
-        pool.busy -= 1
-        self.buf[in_idx] -= 1
-        self.buf[out_idx] += 1
-        
-        heapq.heappush(self.h, (self.now, f"try_{name}", None))  # Can try again
-        
-        # Notify upstream that buffer space freed
-        prev = ["SEP","B1","B2","B3"][k]
-        heapq.heappush(self.h, (self.now, f"try_{prev}", None))
-        
-        # Notify downstream that product available
-        nxt = ["B2","B3","B4","GLUE"][k]
-        heapq.heappush(self.h, (self.now, f"try_{nxt}", None))
+        self.pending_try.add(ev)
+        self.now_queue.append(ev)
 
-    # ----- GLUE -----
-    def try_GLUE(self,_):
+    # ----- stations -----
+    def _try(self, k):
+        # OPTIMIZED: No blind retries. Only retry when conditions change.
         if not self.can_run():
-            return
-        if self.glue.busy>=self.glue.servers:
-            return
-        if self.buf[5] <= 0:
-            return  # done_B4 will notify us
-        if self.buf[6] >= self.bufcap[6]:
-            return  # done_PAL will notify us
-        dur = self.t_glue()
-        self.glue.busy += 1
-        heapq.heappush(self.h, (self.now+dur, "done_GLUE", None))
+            return  # pause_end will schedule retry
+        busy = self.busy
+        if busy[k]>=self.servers[k]:
+            return  # our own _done will retry
+        in_idx, out_idx, dur, draw = self._stations[k]
+        buf = self.buf
+        if in_idx is not None and buf[in_idx] <= 0:
+            self._idle_for_input[k] = True
+            return  # upstream _done will notify us
+        if out_idx is not None and buf[out_idx] >= self.bufcap[out_idx]:
+            self._idle_for_output[k] = True
+            return  # downstream _done will notify us
+        busy[k] += 1
+        if dur is None:
+            dur = draw()
+        heapq.heappush(self.h, (self.now+dur, next(self._seq), EV_DONE_CF+k, None))
         
-    def done_GLUE(self,_):
-        self.glue.busy -= 1
-        self.buf[5] -= 1
-        self.buf[6] += 1
-        heapq.heappush(self.h, (self.now, "try_GLUE", None))
-        heapq.heappush(self.h, (self.now, "try_B4", None))   # Notify upstream
-        heapq.heappush(self.h, (self.now, "try_PAL", None))  # Notify downstream
-
-    # ----- PALLETIZER -----
-    def try_PAL(self,_):
-        if not self.can_run():
-            return
-        if self.pal.busy>=self.pal.servers:
-            return
-        if self.buf[6] <= 0:
-            return  # done_GLUE will notify us
-        dur = self.t_pal()
-        self.pal.busy += 1
-        heapq.heappush(self.h, (self.now+dur, "done_PAL", None))
+    def _done(self, k):
+        in_idx, out_idx, _, _ = self._stations[k]
+        buf = self.buf
+        self.busy[k] -= 1
+        if in_idx is not None:
+            buf[in_idx] -= 1
+        if out_idx is not None:
+            buf[out_idx] += 1
+        else:
+            self._case_out()
         
-    def done_PAL(self,_):
-        self.pal.busy -= 1
-        self.buf[6] -= 1
-        self.cases_out += 1
+        self._try(k)  # Can try again
+        # Notify neighbours only if they are parked on what we just changed;
+        # a busy neighbour retries from its own _done
+        if in_idx is not None and self._idle_for_output[k-1]:
+            self._idle_for_output[k-1] = False
+            self._try(k-1)  # upstream: buffer freed
+        if out_idx is not None and self._idle_for_input[k+1]:
+            self._idle_for_input[k+1] = False
+            self._try(k+1)  # downstream: product available
+
+    # ----- PALLETIZER output -----
+    def _case_out(self):
+        cases = self.cases_out = self.cases_out + 1
         
         # lock enforcement: first pallet after pause must be the incomplete one
-        if self.lock_active and self.lock_target_cases is not None and self.cases_out >= self.lock_target_cases:
-            if self.cases_out % self.cfg["cases_per_pallet"] == 0:
-                self.pallets += 1
-                self.events.append((self.pallets, int(self.now)))
-                print(f"Pallet {self.pallets} at {hhmmss(int(self.now))} [COMPLETE]")
+        unlock = self.lock_active and self.lock_target_cases is not None and cases >= self.lock_target_cases
+        if cases % self._cpp == 0:
+            pallets = self.pallets = self.pallets + 1
+            t_int = int(self.now)
+            self.pallet_times.append(t_int)
+            if self.verbose:
+                self._stdout_lines.append(f"Pallet {pallets} at {hhmmss(t_int)}" + (" [COMPLETE]" if unlock else ""))
+        if unlock:
             self.lock_active = False
             self.lock_target_cases = None
-        else:
-            if self.cases_out % self.cfg["cases_per_pallet"] == 0:
-                self.pallets += 1
-                self.events.append((self.pallets, int(self.now)))
-                print(f"Pallet {self.pallets} at {hhmmss(int(self.now))}")
-                
-        heapq.heappush(self.h, (self.now, "try_PAL", None))   # Can try again
-        heapq.heappush(self.h, (self.now, "try_GLUE", None))  # Notify upstream
 
     # ----- pause logic -----
     def _mark_incomplete(self, label, start_t, end_t):
-        in_pallet = self.cases_out % self.cfg["cases_per_pallet"]
+        cpp = self._cpp
+        in_pallet = self.cases_out % cpp
         if in_pallet > 0:
-            current_idx = self.cases_out // self.cfg["cases_per_pallet"] + 1
-            print(f"Pallet {current_idx} at {hhmmss(int(start_t))} [INCOMPLETE]")
+            current_idx = self.cases_out // cpp + 1
+            if self.verbose:
+                self._stdout_lines.append(f"Pallet {current_idx} at {hhmmss(int(start_t))} [INCOMPLETE]")
             self.lock_active = True
-            self.lock_target_cases = current_idx * self.cfg["cases_per_pallet"]
-        print(f"{label}_START {hhmmss(int(start_t))} → {hhmmss(int(end_t))} | pallet_progress {in_pallet}/{self.cfg['cases_per_pallet']} (INCOMPLETE)")
-        self.log.append((f"{label}_START", int(start_t), in_pallet, self.cfg["cases_per_pallet"]))
+            self.lock_target_cases = current_idx * cpp
+        if self.verbose:
+            self._stdout_lines.append(f"{label}_START {hhmmss(int(start_t))} → {hhmmss(int(end_t))} | pallet_progress {in_pallet}/{cpp} (INCOMPLETE)")
+        self.log.append((f"{label}_START", int(start_t), in_pallet, cpp))
         
-        # shift any done_* events that fall inside pause
+        # shift any done_* events that fall inside pause, then re-heapify once
+        # (in place: run() holds a reference to self.h)
         pause = end_t - start_t
-        new=[]
-        while self.h:
-            t, typ, payload = heapq.heappop(self.h)
-            if t>start_t and t<end_t and typ.startswith("done_"):
-                t += pause
-            new.append((t,typ,payload))
-        for x in new: heapq.heappush(self.h, x)
+        self.h[:] = [(t+pause if start_t<t<end_t and EV_DONE_CF<=typ<=EV_DONE_PAL else t, seq, typ, payload)
+                     for t, seq, typ, payload in self.h]
+        heapq.heapify(self.h)
 
     def _end_pause(self, label, end_t):
-        print(f"{label}_END   {hhmmss(int(end_t))}")
+        if self.verbose:
+            self._stdout_lines.append(f"{label}_END   {hhmmss(int(end_t))}")
         self.log.append((f"{label}_END", int(end_t), None, None))
         
         # Nudge all stations to check if they can run
-        for name in ["try_CF","try_SEP","try_B1","try_B2","try_B3","try_B4","try_GLUE","try_PAL"]:
-            heapq.heappush(self.h, (end_t, name, None))
+        # (pause_end is dispatched at self.now == end_t)
+        for ev in range(EV_TRY_CF, EV_TRY_PAL+1):
+            self._notify(ev)
 
     # ----- event loop -----
     def run(self):
-        handlers_try = {
-            "try_CF": self.try_CF,
-            "try_SEP": self.try_SEP,
-            "try_B1": lambda _ : self.try_B(0,"B1"),
-            "try_B2": lambda _ : self.try_B(1,"B2"),
-            "try_B3": lambda _ : self.try_B(2,"B3"),
-            "try_B4": lambda _ : self.try_B(3,"B4"),
-            "try_GLUE": self.try_GLUE,
-            "try_PAL": self.try_PAL,
-        }
-        handlers_done = {
-            "done_CF": self.done_CF,
-            "done_SEP": self.done_SEP,
-            "done_B1": lambda _ : self.done_B(0,"B1"),
-            "done_B2": lambda _ : self.done_B(1,"B2"),
-            "done_B3": lambda _ : self.done_B(2,"B3"),
-            "done_B4": lambda _ : self.done_B(3,"B4"),
-            "done_GLUE": self.done_GLUE,
-            "done_PAL": self.done_PAL,
-        }
-
-        while self.h and self.now < self.shift_end:
-            t, typ, payload = heapq.heappop(self.h)
-            self.now = t
-            if typ == "pause_start":
+        # Hot loop: bind everything it touches to locals once
+        try_ = self._try
+        done = self._done
+        now_queue = self.now_queue
+        popleft = now_queue.popleft
+        discard = self.pending_try.discard
+        h = self.h
+        heappop = heapq.heappop
+        shift_end = self.shift_end
+
+        now = self.now
+        while now < shift_end:
+            # drain zero-delay events before advancing the clock
+            while now_queue:
+                typ = popleft()
+                discard(typ)
+                try_(typ)
+            if not h:
+                break
+            now, _, typ, payload = heappop(h)
+            self.now = now
+            if typ < EV_PAUSE_START:  # the heap only holds done_* and pause events
+                done(typ - EV_DONE_CF)
+            elif typ == EV_PAUSE_START:
                 label, ps, pe = payload
                 self._mark_incomplete(label, ps, pe)
-            elif typ == "pause_end":
+            else:
                 label, ps, pe = payload
                 self._end_pause(label, pe)
-            elif typ.startswith("try_"):
-                handlers_try[typ](payload)
-            elif typ.startswith("done_"):
-                handlers_done[typ](payload)
+
+        if self._stdout_lines:
+            sys.stdout.write("\n".join(self._stdout_lines) + "\n")
+            self._stdout_lines.clear()
 
         return {"cases_out": self.cases_out, "pallets_out": self.pallets,
-                "events": self.events, "log": self.log}
+                "pallet_times": self.pallet_times, "log": self.log}
+
+# ----------------- replications -----------------
+def _run_replication(cfg):
+    return cfg["seed"], Sim(cfg).run()
+
+def _gil_disabled():
+    # free-threaded CPython (3.13t+) running with the GIL off
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+def run_replications(cfg, seeds, n_workers=None):
+    """Run one independent Sim per seed across processes (or threads on a
+    free-threaded build). Returns [(seed, result), ...] in the order of `seeds`."""
+    cfgs = [dict(cfg, seed=s, verbose=False) for s in seeds]
+    if _gil_disabled():
+        # each thread owns its Sim; results come back without pickling
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            return list(ex.map(_run_replication, cfgs))
+    # forkserver: workers start from a clean, already-imported server process
+    ctx = multiprocessing.get_context("forkserver") if sys.platform.startswith("linux") else None
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as ex:
+        return list(ex.map(_run_replication, cfgs))
 
 # ----------------- run -----------------
 if __name__ == "__main__":
-    random.seed(CONFIG["seed"])
     sim = Sim(CONFIG)
     res = sim.run()
 
+    # Row-heavy files are built as one string and written once; "\r\n" matches
+    # csv.writer's default line terminator.
     with open("pallet_events.csv","w",newline="") as f:
-        w=csv.writer(f); w.writerow(["pallet_seq","time_sec_from_midnight","clock_time"])
-        for seq,t in res["events"]: w.writerow([seq,t,hhmmss(t)])
+        lines = ["pallet_seq,time_sec_from_midnight,clock_time"]
+        lines += [f"{seq},{t},{hhmmss(t)}" for seq,t in enumerate(res["pallet_times"], 1)]
+        f.write("\r\n".join(lines) + "\r\n")
 
     with open("sim_summary.csv","w",newline="") as f:
         w=csv.writer(f)
@@ -379,6 +392,14 @@ if __name__ == "__main__":
         w.writerow(["buffers", CONFIG["buffers"]])
 
     with open("line_log.csv","w",newline="") as f:
-        w=csv.writer(f); w.writerow(["event","time_sec","clock","in_pallet_cases","pallet_size"])
-        for e,t,a,b in res["log"]:
-            w.writerow([e, t, hhmmss(t), a, b])
\ No newline at end of file
+        lines = ["event,time_sec,clock,in_pallet_cases,pallet_size"]
+        lines += [f"{e},{t},{hhmmss(t)},{'' if a is None else a},{'' if b is None else b}"
+                  for e,t,a,b in res["log"]]
+        f.write("\r\n".join(lines) + "\r\n")
+
+    if CONFIG["replication_seeds"]:
+        reps = run_replications(CONFIG, CONFIG["replication_seeds"], CONFIG["replication_workers"])
+        with open("replications.csv","w",newline="") as f:
+            lines = ["seed,cases_out,pallets_out"]
+            lines += [f"{seed},{r['cases_out']},{r['pallets_out']}" for seed,r in reps]
+            f.write("\r\n".join(lines) + "\r\n")